@@ -29,25 +29,189 @@ Date: February 16, 2026
 License: MIT
 """
 
-import argparse
-import cProfile
+import copy
+import functools
+import heapq
+import itertools
 import json
-import pstats
+import os
 import sys
 import time
-from dataclasses import dataclass, asdict
-from io import StringIO
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
-import tempfile
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# cProfile, pstats, multiprocessing and argparse are imported where used,
+# so importing ProfileScope for its data classes stays cheap
+if TYPE_CHECKING:
+    import pstats
+
+try:
+    import orjson  # Optional: faster JSON export/parsing when installed
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # Optional: compact binary report format
+except ImportError:
+    msgpack = None
 
 
 # Version
 __version__ = "1.0.0"
 
+# Regression thresholds for compare_reports (percent increase)
+_TIME_REGRESSION_PERCENT = 10.0
+_CALLS_REGRESSION_PERCENT = 20.0
 
-@dataclass
-class FunctionStats:
+# Per-function time changes smaller than this (seconds) are timer noise
+_MIN_FUNCTION_DELTA_SECONDS = 0.001
+
+# File suffix for binary msgpack reports
+_MSGPACK_SUFFIX = ".mpk"
+
+# Per-process sequence number for unique report filenames
+_report_counter = itertools.count()
+
+# Terminal report separators and table header
+_SEP_EQ = "=" * 80
+_SEP_DASH = "-" * 80
+_HOT_FUNCTIONS_HEADER = f"{'Function':<40} {'Time (s)':<12} {'Calls':<12} {'%':<8}"
+
+# Markdown/HTML report headers up to the hot-function table rows
+# (formatted with script=<display name>, report=<ProfileReport>)
+_MD_HEAD = (
+    "# Performance Report: {script}\n\n"
+    "**Total Time:** {report.total_time:.3f}s\n"
+    "**Total Calls:** {report.total_calls:,}\n"
+    "**Timestamp:** {report.timestamp}\n\n"
+    "## Hot Functions\n\n"
+    "| Function | Time (s) | Calls | % |\n"
+    "|----------|----------|-------|---|\n"
+)
+# The stylesheet contains braces, so it is passed in as {style}
+_HTML_HEAD = (
+    "<html><head><title>ProfileScope Report</title>{style}</head><body>"
+    "<h1>Performance Report: {script}</h1>"
+    "<p><strong>Total Time:</strong> {report.total_time:.3f}s</p>"
+    "<p><strong>Total Calls:</strong> {report.total_calls:,}</p>"
+    "<p><strong>Timestamp:</strong> {report.timestamp}</p>"
+    "<h2>Hot Functions</h2>"
+    "<table><tr><th>Function</th><th>Time (s)</th><th>Calls</th><th>%</th></tr>"
+)
+
+# Hot-function table rows for Markdown/HTML reports (formatted with a FunctionStats)
+_MD_ROW = "| {0.name} | {0.cumulative_time:.3f} | {0.total_calls:,} | {0.percentage:.1f}% |\n"
+_HTML_ROW = (
+    "<tr><td>{0.name}</td><td>{0.cumulative_time:.3f}</td>"
+    "<td>{0.total_calls:,}</td><td>{0.percentage:.1f}%</td></tr>"
+)
+
+# Buffer size for streamed Markdown/HTML report writes
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# Stylesheet embedded in HTML reports
+_HTML_STYLE = (
+    "<style>body{font-family:Arial;margin:20px;}table{border-collapse:collapse;width:100%;}"
+    "th,td{border:1px solid #ddd;padding:8px;text-align:left;}th{background:#4CAF50;color:white;}</style>"
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_report_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Load a JSON or msgpack report, cached by path, modification time and size."""
+    data = Path(path_str).read_bytes()
+    if path_str.endswith(_MSGPACK_SUFFIX):
+        return msgpack.unpackb(data, raw=False)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _report_key(path: Path) -> Tuple[str, int, int]:
+    """Cache key for a report file: (path, modification time, size)."""
+    st = path.stat()
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def _function_key(func: Dict[str, Any]) -> Tuple[str, str, int]:
+    """Identity of a hot function across reports: (name, filename, line number)."""
+    return (func['name'], func.get('filename', ''), func.get('line_number', 0))
+
+
+@functools.lru_cache(maxsize=256)
+def _compare_reports_cached(baseline_key: Tuple[str, int, int], current_key: Tuple[str, int, int]) -> Dict[str, Any]:
+    """Compare two reports identified by _report_key, cached per pair of file versions."""
+    baseline = _load_report_cached(*baseline_key)
+    current = _load_report_cached(*current_key)
+    
+    # Compare total times
+    baseline_time = baseline['total_time']
+    current_time = current['total_time']
+    time_change = ((current_time - baseline_time) / baseline_time) * 100 if baseline_time > 0 else 0.0
+    
+    # Compare call counts
+    baseline_calls = baseline['total_calls']
+    current_calls = current['total_calls']
+    calls_change = ((current_calls - baseline_calls) / baseline_calls) * 100 if baseline_calls > 0 else 0.0
+    
+    # Identify new bottlenecks
+    baseline_bottlenecks = set(baseline.get('bottlenecks', []))
+    current_bottlenecks = set(current.get('bottlenecks', []))
+    new_bottlenecks = list(current_bottlenecks - baseline_bottlenecks)
+    fixed_bottlenecks = list(baseline_bottlenecks - current_bottlenecks)
+    
+    # Per-function deltas: index the baseline once, then a single pass over current
+    baseline_by_key = {_function_key(func): func for func in baseline.get('hot_functions', [])}
+    regressed_functions = []
+    improved_functions = []
+    for func in current.get('hot_functions', []):
+        base = baseline_by_key.get(_function_key(func))
+        if base is None or base['cumulative_time'] <= 0:
+            continue
+        # Ignore tiny absolute changes however large they look in percent
+        if abs(func['cumulative_time'] - base['cumulative_time']) < _MIN_FUNCTION_DELTA_SECONDS:
+            continue
+            
+        func_change = (func['cumulative_time'] - base['cumulative_time']) / base['cumulative_time'] * 100
+        if func_change > _TIME_REGRESSION_PERCENT:
+            target = regressed_functions
+        elif func_change < -_TIME_REGRESSION_PERCENT:
+            target = improved_functions
+        else:
+            continue
+            
+        target.append({
+            "name": func['name'],
+            "baseline_time": base['cumulative_time'],
+            "current_time": func['cumulative_time'],
+            "time_change_percent": func_change
+        })
+        
+    comparison = {
+        "baseline_time": baseline_time,
+        "current_time": current_time,
+        "time_change_percent": time_change,
+        "baseline_calls": baseline_calls,
+        "current_calls": current_calls,
+        "calls_change_percent": calls_change,
+        "new_bottlenecks": new_bottlenecks,
+        "fixed_bottlenecks": fixed_bottlenecks,
+        "regressed_functions": regressed_functions,
+        "improved_functions": improved_functions,
+        "regression_detected": time_change > _TIME_REGRESSION_PERCENT or calls_change > _CALLS_REGRESSION_PERCENT
+    }
+    
+    return comparison
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_script(path_str: str, mtime_ns: int, size: int):
+    """Compile a script to a code object, cached by path, modification time and size."""
+    return compile(Path(path_str).read_bytes(), path_str, 'exec')
+
+
+class FunctionStats(NamedTuple):
     """Statistics for a single function."""
     name: str
     filename: str
@@ -64,12 +228,18 @@ class FunctionStats:
 @dataclass
 class ProfileReport:
     """Complete profiling report."""
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        "script_path", "total_time", "total_calls", "hot_functions",
+        "bottlenecks", "call_tree", "recommendations", "timestamp",
+    )
+    
     script_path: str
     total_time: float
     total_calls: int
     hot_functions: List[FunctionStats]
     bottlenecks: List[str]
-    call_tree: Dict[str, any]
+    call_tree: Dict[str, Any]
     recommendations: List[str]
     timestamp: str
 
@@ -89,7 +259,10 @@ class ProfileScope:
             output_dir: Directory for saving reports (default: ./profilescope_reports)
         """
         self.output_dir = output_dir or Path.cwd() / "profilescope_reports"
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Created on first save_report() so terminal-only runs touch no files
+        self._dir_created = False
+        # Last formatted terminal report per flag: show_tree -> (report, text)
+        self._term_cache: Dict[bool, Tuple[ProfileReport, str]] = {}
         
     def profile(self, script_path: Path, script_args: List[str] = None) -> ProfileReport:
         """
@@ -104,176 +277,179 @@ class ProfileScope:
             
         Raises:
             FileNotFoundError: If script doesn't exist
-            RuntimeError: If profiling fails
+            RuntimeError: If profiling fails or the script exits with a non-zero status
         """
-        if not script_path.exists():
+        # Fail fast, before any profiler setup
+        script_path = Path(script_path)
+        if not script_path.is_file():
             raise FileNotFoundError(f"Script not found: {script_path}")
             
         script_args = script_args or []
+        self._term_cache.clear()
+        
+        # Set up sys.argv for the script
+        old_argv = sys.argv
+        sys.argv = [str(script_path)] + script_args
+        
+        import cProfile
+        import pstats
+        
+        # Profile the script
+        profiler = cProfile.Profile()
+        
+        start_time = time.perf_counter()
         
-        # Create temporary file for profiling stats
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.prof') as tmp:
-            tmp_path = tmp.name
-            
         try:
-            # Set up sys.argv for the script
-            old_argv = sys.argv
-            sys.argv = [str(script_path)] + script_args
-            
-            # Profile the script
-            profiler = cProfile.Profile()
-            
-            start_time = time.time()
-            
-            try:
-                # Execute the script in profiler context
-                with open(script_path) as f:
-                    code = compile(f.read(), str(script_path), 'exec')
-                    profiler.runcall(exec, code, {'__name__': '__main__', '__file__': str(script_path)})
-            except Exception as e:
-                raise RuntimeError(f"Script execution failed: {e}")
-            finally:
-                sys.argv = old_argv
-                
-            end_time = time.time()
-            total_time = end_time - start_time
-            
-            # Save profiling stats
-            profiler.dump_stats(tmp_path)
-            
-            # Analyze stats
-            stats = pstats.Stats(tmp_path)
-            
-            # Parse function statistics
-            hot_functions = self._extract_hot_functions(stats, total_time)
+            # Execute the script in profiler context
+            st = script_path.stat()
+            code = _compile_script(str(script_path), st.st_mtime_ns, st.st_size)
+            profiler.runcall(exec, code, {'__name__': '__main__', '__file__': str(script_path)})
+        except SystemExit as e:
+            # sys.exit() / sys.exit(0) is a normal end of script; keep its profile
+            if e.code not in (0, None):
+                raise RuntimeError(f"Script exited with status {e.code}") from e
+        except Exception as e:
+            raise RuntimeError(f"Script execution failed: {e}") from e
+        finally:
+            sys.argv = old_argv
             
-            # Identify bottlenecks
-            bottlenecks = self._identify_bottlenecks(hot_functions)
+        end_time = time.perf_counter()
+        total_time = end_time - start_time
+        
+        # Analyze stats straight from the profiler (no dump/reload round-trip)
+        stats = pstats.Stats(profiler)
+        
+        # Parse function statistics
+        hot_functions = self._extract_hot_functions(stats, total_time)
+        
+        # Identify bottlenecks and generate recommendations
+        bottlenecks, recommendations = self._analyze(hot_functions, total_time)
+        
+        # Extract call tree (simplified)
+        call_tree = self._extract_call_tree(stats)
+        
+        # Build report
+        report = ProfileReport(
+            script_path=str(script_path),
+            total_time=total_time,
+            total_calls=stats.total_calls,
+            hot_functions=hot_functions,
+            bottlenecks=bottlenecks,
+            call_tree=call_tree,
+            recommendations=recommendations,
+            timestamp=time.strftime("%Y-%m-%d %H:%M:%S")
+        )
+        
+        return report
+        
+    def profile_many(self, script_paths: List[Path], max_workers: Optional[int] = None) -> List[ProfileReport]:
+        """
+        Profile several Python scripts in parallel, one fresh process per script.
+        
+        Worker processes are never reused (maxtasksperchild=1), so a script
+        cannot see imports, module-level state or sys.argv changes left behind
+        by another script.
+        
+        Args:
+            script_paths: Paths to Python scripts to profile
+            max_workers: Maximum number of concurrent processes (default: CPU count)
             
-            # Extract call tree (simplified)
-            call_tree = self._extract_call_tree(stats)
+        Returns:
+            List of ProfileReports, in the same order as script_paths
             
-            # Generate recommendations
-            recommendations = self._generate_recommendations(hot_functions, total_time)
+        Raises:
+            FileNotFoundError: If a script doesn't exist
+            RuntimeError: If profiling a script fails
+        """
+        if not script_paths:
+            return []
             
-            # Build report
-            report = ProfileReport(
-                script_path=str(script_path),
-                total_time=total_time,
-                total_calls=stats.total_calls,
-                hot_functions=hot_functions,
-                bottlenecks=bottlenecks,
-                call_tree=call_tree,
-                recommendations=recommendations,
-                timestamp=time.strftime("%Y-%m-%d %H:%M:%S")
+        import multiprocessing
+        
+        # Never start more processes than there are scripts
+        processes = min(len(script_paths), max_workers or os.cpu_count() or 1)
+        
+        # multiprocessing.Pool rather than ProcessPoolExecutor: its
+        # maxtasksperchild works on every supported Python (3.7+)
+        with multiprocessing.Pool(processes=processes, maxtasksperchild=1) as pool:
+            return pool.starmap(
+                _profile_worker,
+                [(self.output_dir, script_path) for script_path in script_paths],
+                chunksize=1
             )
             
-            return report
-            
-        finally:
-            # Clean up temporary file
-            Path(tmp_path).unlink(missing_ok=True)
-            
-    def _extract_hot_functions(self, stats: pstats.Stats, total_time: float, limit: int = 20) -> List[FunctionStats]:
+    def _extract_hot_functions(self, stats: "pstats.Stats", total_time: float, limit: int = 20) -> List[FunctionStats]:
         """Extract top functions by cumulative time."""
-        stats.strip_dirs()
-        stats.sort_stats('cumulative')
-        
-        # Capture stats as string
-        stream = StringIO()
-        stats.stream = stream
-        stats.print_stats(limit)
-        
-        # Parse the output
-        output = stream.getvalue()
-        lines = output.split('\n')
-        
-        hot_functions = []
-        
-        # Skip header lines
-        parsing_stats = False
-        for line in lines:
-            if 'ncalls' in line and 'tottime' in line:
-                parsing_stats = True
-                continue
-                
-            if not parsing_stats:
-                continue
-                
-            # Parse stats line
-            parts = line.split(None, 5)
-            if len(parts) < 6:
-                continue
+        # Select the top entries straight from the raw stats table:
+        # (filename, lineno, funcname) -> (cc, nc, tt, ct, callers)
+        top = heapq.nlargest(limit, stats.stats.items(), key=lambda item: item[1][3])
+        
+        inv_total = 100.0 / total_time if total_time > 0 else 0.0
+        basename = os.path.basename
+        
+        # Only the k winners are materialized. Directories are stripped per
+        # selected row (not stats.strip_dirs(), which rebuilds the whole table
+        # and merges same-named files). Positional FunctionStats fields:
+        # name, filename, line_number, total_calls, primitive_calls, total_time,
+        # cumulative_time, time_per_call, cumulative_per_call, percentage
+        return [
+            FunctionStats(
+                func_name, basename(path), line_number, nc, cc, tt, ct,
+                tt / nc if nc else 0.0, ct / cc if cc else 0.0, ct * inv_total
+            )
+            for (path, line_number, func_name), (cc, nc, tt, ct, _callers) in top
+        ]
+        
+    def _analyze(self, hot_functions: List[FunctionStats], total_time: float) -> Tuple[List[str], List[str]]:
+        """Identify bottlenecks and generate optimization recommendations in one pass."""
+        bottlenecks = []
+        
+        if not hot_functions:
+            return bottlenecks, ["No significant performance issues detected."]
+            
+        high_call_recs = []
+        hot_path_recs = []
+        recursion_recs = []
+        hot_path_threshold = total_time * 0.2
+        
+        for i, func in enumerate(hot_functions):
+            if i == 10:
+                break
                 
-            try:
-                ncalls_str = parts[0]
-                tottime = float(parts[1])
-                tottime_percall = float(parts[2]) if parts[2] != '0.000' else 0.0
-                cumtime = float(parts[3])
-                cumtime_percall = float(parts[4]) if parts[4] != '0.000' else 0.0
-                func_info = parts[5]
+            name = func.name
+            percentage = func.percentage
+            total_calls = func.total_calls
+            
+            # Functions taking > 10% of total time
+            if percentage > 10.0:
+                bottlenecks.append(f"{name} ({percentage:.1f}% of total time)")
                 
-                # Parse function info (format: filename:lineno(function))
-                if ':' in func_info and '(' in func_info:
-                    file_line = func_info.split('(')[0]
-                    func_name = func_info.split('(')[1].rstrip(')')
-                    
-                    if ':' in file_line:
-                        filename, line_no = file_line.rsplit(':', 1)
-                        line_number = int(line_no) if line_no.isdigit() else 0
-                    else:
-                        filename = file_line
-                        line_number = 0
-                else:
-                    filename = "unknown"
-                    line_number = 0
-                    func_name = func_info
+            if i < 5:
+                # High call counts
+                if total_calls > 10000:
+                    high_call_recs.append(
+                        f"Consider optimizing {name}: called {total_calls:,} times"
+                    )
                     
-                # Parse ncalls (format: X or X/Y for primitive/total)
-                if '/' in ncalls_str:
-                    primitive, total = ncalls_str.split('/')
-                    primitive_calls = int(primitive)
-                    total_calls = int(total)
-                else:
-                    primitive_calls = int(ncalls_str)
-                    total_calls = primitive_calls
+                # Slow functions
+                if func.cumulative_time > hot_path_threshold:
+                    hot_path_recs.append(
+                        f"Hot path detected in {name}: {func.cumulative_time:.3f}s ({percentage:.1f}%)"
+                    )
                     
-                percentage = (cumtime / total_time * 100) if total_time > 0 else 0.0
-                
-                func_stats = FunctionStats(
-                    name=func_name,
-                    filename=filename,
-                    line_number=line_number,
-                    total_calls=total_calls,
-                    primitive_calls=primitive_calls,
-                    total_time=tottime,
-                    cumulative_time=cumtime,
-                    time_per_call=tottime_percall,
-                    cumulative_per_call=cumtime_percall,
-                    percentage=percentage
-                )
-                
-                hot_functions.append(func_stats)
-                
-            except (ValueError, IndexError):
-                continue
-                
-        return hot_functions
-        
-    def _identify_bottlenecks(self, hot_functions: List[FunctionStats]) -> List[str]:
-        """Identify performance bottlenecks."""
-        bottlenecks = []
-        
-        # Check for functions taking > 10% of total time
-        for func in hot_functions[:10]:
-            if func.percentage > 10.0:
-                bottlenecks.append(
-                    f"{func.name} ({func.percentage:.1f}% of total time)"
+            # Recursive calls
+            if func.primitive_calls < total_calls:
+                recursion_recs.append(
+                    f"Recursive function {name}: {total_calls} calls ({func.primitive_calls} primitive)"
                 )
                 
-        return bottlenecks
+        recommendations = high_call_recs + hot_path_recs + recursion_recs
+        if not recommendations:
+            recommendations.append("Performance looks good! No major bottlenecks detected.")
+            
+        return bottlenecks, recommendations
         
-    def _extract_call_tree(self, stats: pstats.Stats) -> Dict[str, any]:
+    def _extract_call_tree(self, stats: "pstats.Stats") -> Dict[str, Any]:
         """Extract simplified call tree."""
         # For v1.0, return summary stats
         # Full call tree would require callers/callees analysis
@@ -283,97 +459,124 @@ class ProfileScope:
             "total_functions": len(stats.stats)
         }
         
-    def _generate_recommendations(self, hot_functions: List[FunctionStats], total_time: float) -> List[str]:
-        """Generate optimization recommendations."""
-        recommendations = []
+    def format_terminal_report(self, report: ProfileReport, show_tree: bool = False) -> str:
+        """
+        Format report for terminal display.
         
-        if not hot_functions:
-            recommendations.append("No significant performance issues detected.")
-            return recommendations
-            
-        # Check for high call counts
-        for func in hot_functions[:5]:
-            if func.total_calls > 10000:
-                recommendations.append(
-                    f"Consider optimizing {func.name}: called {func.total_calls:,} times"
-                )
+        Only the most recently formatted report is cached for each show_tree
+        flag (at most two entries), and profile() clears the cache. Reports
+        are treated as immutable once built.
+        """
+        cached = self._term_cache.get(show_tree)
+        if cached is not None and cached[0] is report:
+            return cached[1]
+            
+        def _lines():
+            # Header
+            yield _SEP_EQ
+            yield "PROFILESCOPE PERFORMANCE REPORT"
+            yield _SEP_EQ
+            yield f"Script: {report.script_path}"
+            yield f"Total Time: {report.total_time:.3f}s"
+            yield f"Total Calls: {report.total_calls:,}"
+            yield f"Timestamp: {report.timestamp}"
+            yield _SEP_EQ
+            yield ""
+            
+            # Hot functions
+            if report.hot_functions:
+                yield "[HOT FUNCTIONS - Top 10 by Cumulative Time]"
+                yield _SEP_DASH
+                yield _HOT_FUNCTIONS_HEADER
+                yield _SEP_DASH
                 
-        # Check for slow functions
-        for func in hot_functions[:5]:
-            if func.cumulative_time > total_time * 0.2:
-                recommendations.append(
-                    f"Hot path detected in {func.name}: {func.cumulative_time:.3f}s ({func.percentage:.1f}%)"
-                )
+                for func in report.hot_functions[:10]:
+                    yield f"{func.name[:38]:<40} {func.cumulative_time:<12.3f} {func.total_calls:<12,} {func.percentage:<8.1f}"
+                yield ""
                 
-        # Check for recursive calls
-        for func in hot_functions[:10]:
-            if func.primitive_calls < func.total_calls:
-                recommendations.append(
-                    f"Recursive function {func.name}: {func.total_calls} calls ({func.primitive_calls} primitive)"
-                )
+            # Bottlenecks
+            if report.bottlenecks:
+                yield "[BOTTLENECKS DETECTED]"
+                yield _SEP_DASH
+                for bottleneck in report.bottlenecks:
+                    yield f"[!] {bottleneck}"
+                yield ""
                 
-        if not recommendations:
-            recommendations.append("Performance looks good! No major bottlenecks detected.")
+            # Recommendations
+            if report.recommendations:
+                yield "[OPTIMIZATION RECOMMENDATIONS]"
+                yield _SEP_DASH
+                for i, rec in enumerate(report.recommendations, 1):
+                    yield f"{i}. {rec}"
+                yield ""
+                
+            # Call tree summary
+            if show_tree:
+                yield "[CALL TREE SUMMARY]"
+                yield _SEP_DASH
+                yield f"Total Functions: {report.call_tree['total_functions']}"
+                yield f"Primitive Calls: {report.call_tree['primitive_calls']:,}"
+                yield f"Total Calls: {report.call_tree['total_calls']:,}"
+                yield ""
+                
+            yield _SEP_EQ
             
-        return recommendations
+        text = '\n'.join(_lines())
+        self._term_cache[show_tree] = (report, text)
+        return text
+        
+    def _iter_markdown_report(self, report: ProfileReport, display_name: str) -> Iterator[str]:
+        """Yield the Markdown report in chunks, in document order."""
+        yield _MD_HEAD.format(script=display_name, report=report)
+        for func in report.hot_functions[:10]:
+            yield _MD_ROW.format(func)
+        yield "\n"
         
-    def format_terminal_report(self, report: ProfileReport, show_tree: bool = False) -> str:
-        """Format report for terminal display."""
-        lines = []
-        
-        # Header
-        lines.append("=" * 80)
-        lines.append("PROFILESCOPE PERFORMANCE REPORT")
-        lines.append("=" * 80)
-        lines.append(f"Script: {report.script_path}")
-        lines.append(f"Total Time: {report.total_time:.3f}s")
-        lines.append(f"Total Calls: {report.total_calls:,}")
-        lines.append(f"Timestamp: {report.timestamp}")
-        lines.append("=" * 80)
-        lines.append("")
-        
-        # Hot functions
-        if report.hot_functions:
-            lines.append("[HOT FUNCTIONS - Top 10 by Cumulative Time]")
-            lines.append("-" * 80)
-            lines.append(f"{'Function':<40} {'Time (s)':<12} {'Calls':<12} {'%':<8}")
-            lines.append("-" * 80)
-            
-            for func in report.hot_functions[:10]:
-                name = func.name[:38] if len(func.name) > 38 else func.name
-                lines.append(
-                    f"{name:<40} {func.cumulative_time:<12.3f} {func.total_calls:<12,} {func.percentage:<8.1f}"
-                )
-            lines.append("")
-            
-        # Bottlenecks
         if report.bottlenecks:
-            lines.append("[BOTTLENECKS DETECTED]")
-            lines.append("-" * 80)
+            yield "## Bottlenecks\n\n"
             for bottleneck in report.bottlenecks:
-                lines.append(f"[!] {bottleneck}")
-            lines.append("")
+                yield f"- {bottleneck}\n"
+            yield "\n"
             
-        # Recommendations
         if report.recommendations:
-            lines.append("[OPTIMIZATION RECOMMENDATIONS]")
-            lines.append("-" * 80)
+            yield "## Recommendations\n\n"
             for i, rec in enumerate(report.recommendations, 1):
-                lines.append(f"{i}. {rec}")
-            lines.append("")
+                yield f"{i}. {rec}\n"
+            yield "\n"
+            
+    def _iter_html_report(self, report: ProfileReport, display_name: str) -> Iterator[str]:
+        """Yield the HTML report in chunks, in document order."""
+        yield _HTML_HEAD.format(style=_HTML_STYLE, script=display_name, report=report)
+        for func in report.hot_functions[:10]:
+            yield _HTML_ROW.format(func)
+        yield "</table>"
+        
+        if report.bottlenecks:
+            yield "<h2>Bottlenecks</h2><ul>"
+            for bottleneck in report.bottlenecks:
+                yield f"<li>{bottleneck}</li>"
+            yield "</ul>"
             
-        # Call tree summary
-        if show_tree:
-            lines.append("[CALL TREE SUMMARY]")
-            lines.append("-" * 80)
-            lines.append(f"Total Functions: {report.call_tree['total_functions']}")
-            lines.append(f"Primitive Calls: {report.call_tree['primitive_calls']:,}")
-            lines.append(f"Total Calls: {report.call_tree['total_calls']:,}")
-            lines.append("")
+        if report.recommendations:
+            yield "<h2>Recommendations</h2><ol>"
+            for rec in report.recommendations:
+                yield f"<li>{rec}</li>"
+            yield "</ol>"
             
-        lines.append("=" * 80)
+        yield "</body></html>"
         
-        return '\n'.join(lines)
+    def _report_to_dict(self, report: ProfileReport) -> Dict[str, Any]:
+        """Convert a report to plain dicts/lists for serialization."""
+        return {
+            "script_path": report.script_path,
+            "total_time": report.total_time,
+            "total_calls": report.total_calls,
+            "hot_functions": [f._asdict() for f in report.hot_functions],
+            "bottlenecks": report.bottlenecks,
+            "call_tree": report.call_tree,
+            "recommendations": report.recommendations,
+            "timestamp": report.timestamp
+        }
         
     def save_report(self, report: ProfileReport, format: str = "json") -> Path:
         """
@@ -381,107 +584,73 @@ class ProfileScope:
         
         Args:
             report: ProfileReport to save
-            format: Output format ('json', 'markdown', 'html')
+            format: Output format ('json', 'msgpack', 'markdown', 'html')
             
         Returns:
             Path to saved report file
+            
+        Raises:
+            ValueError: If format is not supported
+            RuntimeError: If format is 'msgpack' and msgpack isn't installed
         """
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        script_name = Path(report.script_path).stem
+        if format == "msgpack" and msgpack is None:
+            raise RuntimeError("msgpack format requires the 'msgpack' package (pip install msgpack)")
+            
+        if not self._dir_created:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_created = True
+            
+        # pid + counter keep names unique within a second and across workers
+        timestamp = f"{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{next(_report_counter)}"
+        script_path = Path(report.script_path)
+        script_name = script_path.stem
+        display_name = script_path.name
         
         if format == "json":
             filename = f"{script_name}_{timestamp}.json"
             filepath = self.output_dir / filename
             
-            # Convert report to dict
-            report_dict = {
-                "script_path": report.script_path,
-                "total_time": report.total_time,
-                "total_calls": report.total_calls,
-                "hot_functions": [asdict(f) for f in report.hot_functions],
-                "bottlenecks": report.bottlenecks,
-                "call_tree": report.call_tree,
-                "recommendations": report.recommendations,
-                "timestamp": report.timestamp
-            }
-            
-            with open(filepath, 'w') as f:
-                json.dump(report_dict, f, indent=2)
+            if orjson is not None:
+                # orjson serializes the report dataclass natively; FunctionStats
+                # tuples go through _asdict() so they stay JSON objects
+                filepath.write_bytes(orjson.dumps(report, default=FunctionStats._asdict))
+            else:
+                # Compact output: reports are consumed by compare_reports
+                with open(filepath, 'w') as f:
+                    json.dump(self._report_to_dict(report), f, separators=(",", ":"))
                 
+        elif format == "msgpack":
+            filename = f"{script_name}_{timestamp}{_MSGPACK_SUFFIX}"
+            filepath = self.output_dir / filename
+            
+            filepath.write_bytes(msgpack.packb(self._report_to_dict(report), use_bin_type=True))
+            
         elif format == "markdown":
             filename = f"{script_name}_{timestamp}.md"
             filepath = self.output_dir / filename
             
-            with open(filepath, 'w') as f:
-                f.write(f"# Performance Report: {Path(report.script_path).name}\n\n")
-                f.write(f"**Total Time:** {report.total_time:.3f}s\n")
-                f.write(f"**Total Calls:** {report.total_calls:,}\n")
-                f.write(f"**Timestamp:** {report.timestamp}\n\n")
-                
-                f.write("## Hot Functions\n\n")
-                f.write("| Function | Time (s) | Calls | % |\n")
-                f.write("|----------|----------|-------|---|\n")
-                for func in report.hot_functions[:10]:
-                    f.write(f"| {func.name} | {func.cumulative_time:.3f} | {func.total_calls:,} | {func.percentage:.1f}% |\n")
-                f.write("\n")
-                
-                if report.bottlenecks:
-                    f.write("## Bottlenecks\n\n")
-                    for bottleneck in report.bottlenecks:
-                        f.write(f"- {bottleneck}\n")
-                    f.write("\n")
-                    
-                if report.recommendations:
-                    f.write("## Recommendations\n\n")
-                    for i, rec in enumerate(report.recommendations, 1):
-                        f.write(f"{i}. {rec}\n")
-                    f.write("\n")
+            with open(filepath, 'w', encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+                f.writelines(self._iter_markdown_report(report, display_name))
                     
         elif format == "html":
             filename = f"{script_name}_{timestamp}.html"
             filepath = self.output_dir / filename
             
-            with open(filepath, 'w') as f:
-                f.write("<html><head><title>ProfileScope Report</title>")
-                f.write("<style>body{font-family:Arial;margin:20px;}table{border-collapse:collapse;width:100%;}th,td{border:1px solid #ddd;padding:8px;text-align:left;}th{background:#4CAF50;color:white;}</style>")
-                f.write("</head><body>")
-                f.write(f"<h1>Performance Report: {Path(report.script_path).name}</h1>")
-                f.write(f"<p><strong>Total Time:</strong> {report.total_time:.3f}s</p>")
-                f.write(f"<p><strong>Total Calls:</strong> {report.total_calls:,}</p>")
-                f.write(f"<p><strong>Timestamp:</strong> {report.timestamp}</p>")
-                
-                f.write("<h2>Hot Functions</h2>")
-                f.write("<table><tr><th>Function</th><th>Time (s)</th><th>Calls</th><th>%</th></tr>")
-                for func in report.hot_functions[:10]:
-                    f.write(f"<tr><td>{func.name}</td><td>{func.cumulative_time:.3f}</td><td>{func.total_calls:,}</td><td>{func.percentage:.1f}%</td></tr>")
-                f.write("</table>")
-                
-                if report.bottlenecks:
-                    f.write("<h2>Bottlenecks</h2><ul>")
-                    for bottleneck in report.bottlenecks:
-                        f.write(f"<li>{bottleneck}</li>")
-                    f.write("</ul>")
-                    
-                if report.recommendations:
-                    f.write("<h2>Recommendations</h2><ol>")
-                    for rec in report.recommendations:
-                        f.write(f"<li>{rec}</li>")
-                    f.write("</ol>")
-                    
-                f.write("</body></html>")
+            with open(filepath, 'w', encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+                f.writelines(self._iter_html_report(report, display_name))
                 
         else:
             raise ValueError(f"Unsupported format: {format}")
             
         return filepath
         
-    def compare_reports(self, baseline_path: Path, current_path: Path) -> Dict[str, any]:
+    def compare_reports(self, baseline_path: Path, current_path: Path) -> Dict[str, Any]:
         """
         Compare two profiling reports to detect regressions.
         
         Args:
-            baseline_path: Path to baseline JSON report
-            current_path: Path to current JSON report
+            baseline_path: Path to baseline report (JSON, or msgpack if .mpk)
+            current_path: Path to current report (JSON, or msgpack if .mpk)
             
         Returns:
             Dictionary with comparison results
@@ -489,50 +658,35 @@ class ProfileScope:
         Raises:
             FileNotFoundError: If report files don't exist
             ValueError: If reports can't be parsed
+            RuntimeError: If a .mpk report is given and msgpack isn't installed
         """
         if not baseline_path.exists():
             raise FileNotFoundError(f"Baseline report not found: {baseline_path}")
         if not current_path.exists():
             raise FileNotFoundError(f"Current report not found: {current_path}")
+        if msgpack is None and _MSGPACK_SUFFIX in (baseline_path.suffix, current_path.suffix):
+            raise RuntimeError("Comparing .mpk reports requires the 'msgpack' package (pip install msgpack)")
             
-        with open(baseline_path) as f:
-            baseline = json.load(f)
-        with open(current_path) as f:
-            current = json.load(f)
-            
-        # Compare total times
-        baseline_time = baseline['total_time']
-        current_time = current['total_time']
-        time_change = ((current_time - baseline_time) / baseline_time) * 100 if baseline_time > 0 else 0.0
-        
-        # Compare call counts
-        baseline_calls = baseline['total_calls']
-        current_calls = current['total_calls']
-        calls_change = ((current_calls - baseline_calls) / baseline_calls) * 100 if baseline_calls > 0 else 0.0
-        
-        # Identify new bottlenecks
-        baseline_bottlenecks = set(baseline.get('bottlenecks', []))
-        current_bottlenecks = set(current.get('bottlenecks', []))
-        new_bottlenecks = list(current_bottlenecks - baseline_bottlenecks)
-        fixed_bottlenecks = list(baseline_bottlenecks - current_bottlenecks)
-        
-        comparison = {
-            "baseline_time": baseline_time,
-            "current_time": current_time,
-            "time_change_percent": time_change,
-            "baseline_calls": baseline_calls,
-            "current_calls": current_calls,
-            "calls_change_percent": calls_change,
-            "new_bottlenecks": new_bottlenecks,
-            "fixed_bottlenecks": fixed_bottlenecks,
-            "regression_detected": time_change > 10.0 or calls_change > 20.0
-        }
+        comparison = _compare_reports_cached(_report_key(baseline_path), _report_key(current_path))
         
-        return comparison
+        # Copy so callers can't mutate the cached result
+        return copy.deepcopy(comparison)
+
+
+def _profile_worker(output_dir: Path, script_path: Path) -> ProfileReport:
+    """Profile a single script inside a ProfileScope.profile_many worker process."""
+    try:
+        return ProfileScope(output_dir=output_dir).profile(script_path)
+    except SystemExit as e:
+        # A SystemExit escaping a pool task kills the worker and its result
+        # never arrives, hanging the caller; report it as a failure instead
+        raise RuntimeError(f"Script exited with status {e.code}: {script_path}") from e
 
 
 def main():
     """CLI entry point."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='ProfileScope - Python Performance Profiler with Beautiful Reports',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -565,15 +719,15 @@ For more information: https://github.com/DonkRonk17/ProfileScope
     run_parser = subparsers.add_parser('run', help='Profile a Python script')
     run_parser.add_argument('script', type=Path, help='Python script to profile')
     run_parser.add_argument('script_args', nargs=argparse.REMAINDER, help='Arguments to pass to script')
-    run_parser.add_argument('--format', choices=['terminal', 'json', 'markdown', 'html'], 
+    run_parser.add_argument('--format', choices=['terminal', 'json', 'msgpack', 'markdown', 'html'], 
                            default='terminal', help='Report format (default: terminal)')
     run_parser.add_argument('--tree', action='store_true', help='Show call tree summary')
     run_parser.add_argument('--output-dir', type=Path, help='Output directory for reports')
     
     # Compare command
     compare_parser = subparsers.add_parser('compare', help='Compare two profiling reports')
-    compare_parser.add_argument('baseline', type=Path, help='Baseline JSON report')
-    compare_parser.add_argument('current', type=Path, help='Current JSON report')
+    compare_parser.add_argument('baseline', type=Path, help='Baseline report (.json or .mpk)')
+    compare_parser.add_argument('current', type=Path, help='Current report (.json or .mpk)')
     
     args = parser.parse_args()
     
@@ -613,9 +767,9 @@ For more information: https://github.com/DonkRonk17/ProfileScope
             profiler = ProfileScope()
             comparison = profiler.compare_reports(args.baseline, args.current)
             
-            print("=" * 80)
+            print(_SEP_EQ)
             print("PROFILESCOPE COMPARISON REPORT")
-            print("=" * 80)
+            print(_SEP_EQ)
             print(f"Baseline Time: {comparison['baseline_time']:.3f}s")
             print(f"Current Time:  {comparison['current_time']:.3f}s")
             print(f"Change:        {comparison['time_change_percent']:+.1f}%")
@@ -637,13 +791,20 @@ For more information: https://github.com/DonkRonk17/ProfileScope
                     print(f"  - {bottleneck}")
                 print("")
                 
+            if comparison['regressed_functions']:
+                print("[!] Slower Functions:")
+                for func in comparison['regressed_functions']:
+                    print(f"  - {func['name']}: {func['baseline_time']:.3f}s -> "
+                          f"{func['current_time']:.3f}s ({func['time_change_percent']:+.1f}%)")
+                print("")
+                
             if comparison['regression_detected']:
                 print("[!] REGRESSION DETECTED")
-                print("=" * 80)
+                print(_SEP_EQ)
                 return 1
             else:
                 print("[OK] No significant performance regression")
-                print("=" * 80)
+                print(_SEP_EQ)
                 return 0
                 
         except FileNotFoundError as e:
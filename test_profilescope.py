@@ -13,19 +13,35 @@ Tests cover:
 Run: python test_profilescope.py
 """
 
+import copy
+import io
 import json
+import os
 import sys
 import tempfile
 import time
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+import profilescope
 from profilescope import ProfileScope, FunctionStats, ProfileReport
 
 
+def _fast_rmtree(path):
+    """Remove a test temp directory with one scandir pass per directory."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
 class TestProfileScopeCore(unittest.TestCase):
     """Test core ProfileScope functionality."""
     
@@ -37,21 +53,36 @@ class TestProfileScopeCore(unittest.TestCase):
     def tearDown(self):
         """Clean up after tests."""
         # Remove temp directory
-        import shutil
         if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+            _fast_rmtree(self.temp_dir)
             
     def test_initialization(self):
         """Test ProfileScope initializes correctly."""
         profiler = ProfileScope()
         self.assertIsNotNone(profiler)
-        self.assertTrue(profiler.output_dir.exists())
+        self.assertEqual(profiler.output_dir, Path.cwd() / "profilescope_reports")
         
     def test_initialization_custom_output_dir(self):
         """Test ProfileScope with custom output directory."""
         custom_dir = self.temp_dir / "custom_reports"
         profiler = ProfileScope(output_dir=custom_dir)
+        self.assertEqual(profiler.output_dir, custom_dir)
+        
+    def test_output_dir_created_lazily(self):
+        """Test output directory is only created when a report is saved."""
+        custom_dir = self.temp_dir / "lazy_reports"
+        profiler = ProfileScope(output_dir=custom_dir)
+        self.assertFalse(custom_dir.exists())
+        
+        script = self.temp_dir / "lazy.py"
+        script.write_text("print('lazy')")
+        report = profiler.profile(script)
+        profiler.format_terminal_report(report)
+        self.assertFalse(custom_dir.exists())
+        
+        report_path = profiler.save_report(report, format="json")
         self.assertTrue(custom_dir.exists())
+        self.assertEqual(report_path.parent, custom_dir)
         
     def test_profile_simple_script(self):
         """Test profiling a simple Python script."""
@@ -90,6 +121,97 @@ print(f"Args: {sys.argv[1:]}")
         self.assertIsNotNone(report)
         self.assertGreater(report.total_calls, 0)
         
+    def test_profile_recompiles_modified_script(self):
+        """Test cached bytecode is invalidated when the script changes."""
+        script = self.temp_dir / "cached.py"
+        script.write_text("def first():\n    return 1\n\nfirst()\n")
+        report = self.profiler.profile(script)
+        self.assertIn("first", [f.name for f in report.hot_functions])
+        
+        # Re-profiling the unchanged script reuses the compiled code
+        before = profilescope._compile_script.cache_info()
+        report = self.profiler.profile(script)
+        after = profilescope._compile_script.cache_info()
+        self.assertEqual(after.hits, before.hits + 1)
+        self.assertEqual(after.misses, before.misses)
+        self.assertIn("first", [f.name for f in report.hot_functions])
+        
+        # A same-length rewrite changes only the mtime in the cache key; bump
+        # it explicitly in case the clock is coarse
+        old_mtime_ns = script.stat().st_mtime_ns
+        script.write_text("def other():\n    return 1\n\nother()\n")
+        os.utime(script, ns=(old_mtime_ns + 10**9, old_mtime_ns + 10**9))
+        report = self.profiler.profile(script)
+        self.assertEqual(profilescope._compile_script.cache_info().misses, after.misses + 1)
+        names = [f.name for f in report.hot_functions]
+        self.assertIn("other", names)
+        self.assertNotIn("first", names)
+        
+    def test_profile_many(self):
+        """Test profiling several scripts in parallel."""
+        scripts = []
+        for i in range(3):
+            script = self.temp_dir / f"batch_{i}.py"
+            script.write_text(f"result = sum(range({i + 1} * 100))\n")
+            scripts.append(script)
+            
+        reports = self.profiler.profile_many(scripts, max_workers=2)
+        
+        self.assertEqual(len(reports), 3)
+        for script, report in zip(scripts, reports):
+            self.assertIsInstance(report, ProfileReport)
+            self.assertEqual(report.script_path, str(script))
+            self.assertGreater(report.total_calls, 0)
+            
+    def test_profile_many_isolates_scripts(self):
+        """Test scripts in profile_many never share a process's module state."""
+        leaker = self.temp_dir / "leaker.py"
+        leaker.write_text("import json\njson.PROFILESCOPE_MARK = 'leaked'\n")
+        
+        # Raise inside the second script if it can see the first one's change
+        checker = self.temp_dir / "checker.py"
+        checker.write_text(
+            "import json\n"
+            "if hasattr(json, 'PROFILESCOPE_MARK'):\n"
+            "    raise AssertionError('state leaked between scripts')\n"
+        )
+        
+        # A single worker slot forces both scripts through the same pool
+        reports = self.profiler.profile_many([leaker, checker], max_workers=1)
+        
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(reports[1].script_path, str(checker))
+        
+    def test_profile_many_script_calls_sys_exit(self):
+        """Test profile_many handles scripts ending with sys.exit()."""
+        ok_script = self.temp_dir / "ok.py"
+        ok_script.write_text("result = sum(range(100))\n")
+        exit_script = self.temp_dir / "exits.py"
+        exit_script.write_text("import sys\nresult = sum(range(100))\nsys.exit(0)\n")
+        
+        reports = self.profiler.profile_many([ok_script, exit_script])
+        
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(reports[1].script_path, str(exit_script))
+        self.assertGreater(reports[1].total_calls, 0)
+        
+    def test_profile_many_script_exit_failure(self):
+        """Test profile_many reports a non-zero sys.exit() as an error."""
+        exit_script = self.temp_dir / "fails.py"
+        exit_script.write_text("import sys\nsys.exit(3)\n")
+        
+        with self.assertRaises(RuntimeError):
+            self.profiler.profile_many([exit_script])
+            
+    def test_profile_many_empty(self):
+        """Test profile_many with no scripts returns no reports."""
+        self.assertEqual(self.profiler.profile_many([]), [])
+        
+    def test_profile_many_nonexistent_script(self):
+        """Test profile_many propagates errors from worker processes."""
+        with self.assertRaises(FileNotFoundError):
+            self.profiler.profile_many([self.temp_dir / "nonexistent.py"])
+            
     def test_profile_nonexistent_script(self):
         """Test profiling nonexistent script raises error."""
         fake_script = self.temp_dir / "nonexistent.py"
@@ -97,6 +219,18 @@ print(f"Args: {sys.argv[1:]}")
         with self.assertRaises(FileNotFoundError):
             self.profiler.profile(fake_script)
             
+    def test_profile_script_with_sys_exit(self):
+        """Test sys.exit(0) ends the profile normally and non-zero fails."""
+        script = self.temp_dir / "exit_script.py"
+        script.write_text("import sys\nsys.exit(0)\n")
+        
+        report = self.profiler.profile(script)
+        self.assertGreater(report.total_calls, 0)
+        
+        script.write_text("import sys\nsys.exit(2)\n")
+        with self.assertRaises(RuntimeError):
+            self.profiler.profile(script)
+            
     def test_profile_script_with_error(self):
         """Test profiling script that raises exception."""
         # Create script that raises error
@@ -105,8 +239,16 @@ print(f"Args: {sys.argv[1:]}")
 raise ValueError("Test error")
 """)
         
-        with self.assertRaises(RuntimeError):
+        with self.assertRaises(RuntimeError) as ctx:
             self.profiler.profile(script)
+            
+        # Original exception is chained for debugging
+        self.assertIsInstance(ctx.exception.__cause__, ValueError)
+        
+    def test_profile_directory_raises(self):
+        """Test profiling a directory instead of a script raises error."""
+        with self.assertRaises(FileNotFoundError):
+            self.profiler.profile(self.temp_dir)
 
 
 class TestFunctionStats(unittest.TestCase):
@@ -131,6 +273,9 @@ class TestFunctionStats(unittest.TestCase):
         self.assertEqual(stats.total_calls, 100)
         self.assertEqual(stats.cumulative_time, 2.0)
         self.assertEqual(stats.percentage, 25.0)
+        
+        # Slotted: no per-instance __dict__
+        self.assertFalse(hasattr(stats, "__dict__"))
 
 
 class TestReportGeneration(unittest.TestCase):
@@ -162,9 +307,8 @@ fast_function()
         
     def tearDown(self):
         """Clean up after tests."""
-        import shutil
         if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+            _fast_rmtree(self.temp_dir)
             
     def test_format_terminal_report(self):
         """Test formatting report for terminal display."""
@@ -185,6 +329,30 @@ fast_function()
         self.assertIn("CALL TREE SUMMARY", terminal_output)
         self.assertIn("Total Functions:", terminal_output)
         
+    def test_format_terminal_report_cached(self):
+        """Test repeated formatting of the same report reuses the result."""
+        report = self.profiler.profile(self.script)
+        first = self.profiler.format_terminal_report(report)
+        
+        self.assertIs(self.profiler.format_terminal_report(report), first)
+        self.assertIn("CALL TREE SUMMARY", self.profiler.format_terminal_report(report, show_tree=True))
+        
+        # A new profile run invalidates cached output
+        self.profiler.profile(self.script)
+        self.assertIsNot(self.profiler.format_terminal_report(report), first)
+        
+    def test_format_terminal_report_cache_bounded(self):
+        """Test the format cache keeps only the latest report per flag."""
+        report = self.profiler.profile(self.script)
+        reports = [report, copy.copy(report), copy.copy(report)]
+        for report in reports:
+            self.profiler.format_terminal_report(report)
+            self.profiler.format_terminal_report(report, show_tree=True)
+            
+        self.assertEqual(len(self.profiler._term_cache), 2)
+        for cached_report, _text in self.profiler._term_cache.values():
+            self.assertIs(cached_report, reports[-1])
+        
     def test_hot_functions_extraction(self):
         """Test extracting hot functions from stats."""
         report = self.profiler.profile(self.script)
@@ -217,27 +385,28 @@ fast_function()
 class TestReportExport(unittest.TestCase):
     """Test exporting reports to different formats."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.profiler = ProfileScope(output_dir=self.temp_dir)
-        
-        # Create and profile test script
-        self.script = self.temp_dir / "export_test.py"
-        self.script.write_text("""
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared fixtures: every test exports the same report."""
+        cls.temp_dir = Path(tempfile.mkdtemp())
+        cls.profiler = ProfileScope(output_dir=cls.temp_dir)
+        
+        # Create and profile test script once for the whole class
+        cls.script = cls.temp_dir / "export_test.py"
+        cls.script.write_text("""
 def compute():
     return sum(range(100))
 
 compute()
 """)
         
-        self.report = self.profiler.profile(self.script)
+        cls.report = cls.profiler.profile(cls.script)
         
-    def tearDown(self):
-        """Clean up after tests."""
-        import shutil
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests."""
+        if cls.temp_dir.exists():
+            _fast_rmtree(cls.temp_dir)
             
     def test_save_report_json(self):
         """Test saving report as JSON."""
@@ -254,6 +423,9 @@ compute()
         self.assertIn("total_time", data)
         self.assertIn("hot_functions", data)
         
+        # Hot functions are exported as objects, not positional arrays
+        self.assertIn("cumulative_time", data["hot_functions"][0])
+        
     def test_save_report_markdown(self):
         """Test saving report as Markdown."""
         report_path = self.profiler.save_report(self.report, format="markdown")
@@ -279,6 +451,39 @@ compute()
         self.assertIn("<h1>Performance Report:", content)
         self.assertIn("<table>", content)
         
+    @unittest.skipUnless(profilescope.msgpack, "msgpack not installed")
+    def test_save_report_msgpack(self):
+        """Test saving report as msgpack and comparing it against JSON."""
+        mpk_path = self.profiler.save_report(self.report, format="msgpack")
+        
+        self.assertTrue(mpk_path.exists())
+        self.assertEqual(mpk_path.suffix, ".mpk")
+        
+        data = profilescope.msgpack.unpackb(mpk_path.read_bytes(), raw=False)
+        self.assertEqual(data["script_path"], self.report.script_path)
+        self.assertIn("cumulative_time", data["hot_functions"][0])
+        
+        # Binary and JSON reports can be compared with each other
+        json_path = self.profiler.save_report(self.report, format="json")
+        comparison = self.profiler.compare_reports(mpk_path, json_path)
+        self.assertEqual(comparison["time_change_percent"], 0.0)
+        self.assertFalse(comparison["regression_detected"])
+        
+    @unittest.skipIf(profilescope.msgpack, "msgpack installed")
+    def test_save_report_msgpack_unavailable(self):
+        """Test msgpack format without msgpack installed raises error."""
+        with self.assertRaises(RuntimeError):
+            self.profiler.save_report(self.report, format="msgpack")
+            
+    def test_save_report_unique_filenames(self):
+        """Test saving the same report twice in a row doesn't overwrite."""
+        first = self.profiler.save_report(self.report, format="json")
+        second = self.profiler.save_report(self.report, format="json")
+        
+        self.assertNotEqual(first, second)
+        self.assertTrue(first.exists())
+        self.assertTrue(second.exists())
+        
     def test_save_report_invalid_format(self):
         """Test saving report with invalid format raises error."""
         with self.assertRaises(ValueError):
@@ -295,10 +500,28 @@ class TestReportComparison(unittest.TestCase):
         
     def tearDown(self):
         """Clean up after tests."""
-        import shutil
         if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+            _fast_rmtree(self.temp_dir)
             
+    def _write_report(self, filename, **fields):
+        """Write a synthetic JSON report, overriding the default fields."""
+        report_data = {
+            "script_path": "test.py",
+            "total_time": 1.0,
+            "total_calls": 100,
+            "hot_functions": [],
+            "bottlenecks": [],
+            "call_tree": {},
+            "recommendations": [],
+            "timestamp": "2026-01-01 00:00:00"
+        }
+        report_data.update(fields)
+        
+        report_path = self.temp_dir / filename
+        with open(report_path, 'w') as f:
+            json.dump(report_data, f)
+        return report_path
+        
     def test_compare_reports_same_performance(self):
         """Test comparing two reports with similar performance."""
         # Create test script
@@ -330,30 +553,15 @@ compute()
     def test_compare_reports_with_regression(self):
         """Test detecting performance regression."""
         # Create baseline report (fast)
-        baseline_data = {
-            "script_path": "test.py",
-            "total_time": 1.0,
-            "total_calls": 100,
-            "hot_functions": [],
-            "bottlenecks": [],
-            "call_tree": {},
-            "recommendations": [],
-            "timestamp": "2026-01-01 00:00:00"
-        }
+        baseline_path = self._write_report("baseline.json", total_time=1.0, total_calls=100)
         
-        baseline_path = self.temp_dir / "baseline.json"
-        with open(baseline_path, 'w') as f:
-            json.dump(baseline_data, f)
-            
         # Create current report (slow - regression!)
-        current_data = baseline_data.copy()
-        current_data["total_time"] = 2.5  # 150% slower
-        current_data["total_calls"] = 150  # 50% more calls
+        current_path = self._write_report(
+            "current.json",
+            total_time=2.5,  # 150% slower
+            total_calls=150  # 50% more calls
+        )
         
-        current_path = self.temp_dir / "current.json"
-        with open(current_path, 'w') as f:
-            json.dump(current_data, f)
-            
         # Compare
         comparison = self.profiler.compare_reports(baseline_path, current_path)
         
@@ -363,31 +571,21 @@ compute()
     def test_compare_reports_with_improvement(self):
         """Test detecting performance improvement."""
         # Create baseline report (slow)
-        baseline_data = {
-            "script_path": "test.py",
-            "total_time": 2.0,
-            "total_calls": 200,
-            "hot_functions": [],
-            "bottlenecks": ["slow_function (50% of total time)"],
-            "call_tree": {},
-            "recommendations": [],
-            "timestamp": "2026-01-01 00:00:00"
-        }
+        baseline_path = self._write_report(
+            "baseline.json",
+            total_time=2.0,
+            total_calls=200,
+            bottlenecks=["slow_function (50% of total time)"]
+        )
         
-        baseline_path = self.temp_dir / "baseline.json"
-        with open(baseline_path, 'w') as f:
-            json.dump(baseline_data, f)
-            
         # Create current report (fast - improvement!)
-        current_data = baseline_data.copy()
-        current_data["total_time"] = 1.0  # 50% faster
-        current_data["total_calls"] = 100  # 50% fewer calls
-        current_data["bottlenecks"] = []  # Fixed bottleneck!
-        
-        current_path = self.temp_dir / "current.json"
-        with open(current_path, 'w') as f:
-            json.dump(current_data, f)
-            
+        current_path = self._write_report(
+            "current.json",
+            total_time=1.0,  # 50% faster
+            total_calls=100,  # 50% fewer calls
+            bottlenecks=[]  # Fixed bottleneck!
+        )
+        
         # Compare
         comparison = self.profiler.compare_reports(baseline_path, current_path)
         
@@ -395,6 +593,76 @@ compute()
         self.assertEqual(len(comparison["fixed_bottlenecks"]), 1)
         self.assertFalse(comparison["regression_detected"])
         
+    def test_compare_reports_function_deltas(self):
+        """Test per-function regressions and improvements are reported."""
+        def hot_function(name, cumulative_time):
+            return {
+                "name": name,
+                "filename": "test.py",
+                "line_number": 1,
+                "total_calls": 1,
+                "primitive_calls": 1,
+                "total_time": cumulative_time,
+                "cumulative_time": cumulative_time,
+                "time_per_call": cumulative_time,
+                "cumulative_per_call": cumulative_time,
+                "percentage": 10.0
+            }
+            
+        baseline_path = self._write_report("baseline.json", hot_functions=[
+            hot_function("slower", 0.2),
+            hot_function("faster", 0.4),
+            hot_function("steady", 0.3),
+            hot_function("tiny", 0.0000005),
+        ])
+        current_path = self._write_report("current.json", hot_functions=[
+            hot_function("slower", 0.5),
+            hot_function("faster", 0.1),
+            hot_function("steady", 0.3),
+            hot_function("brand_new", 0.1),
+            hot_function("tiny", 0.000001),
+        ])
+        
+        comparison = self.profiler.compare_reports(baseline_path, current_path)
+        
+        self.assertEqual([f["name"] for f in comparison["regressed_functions"]], ["slower"])
+        self.assertEqual([f["name"] for f in comparison["improved_functions"]], ["faster"])
+        self.assertAlmostEqual(comparison["regressed_functions"][0]["time_change_percent"], 150.0)
+        # "tiny" doubled, but its sub-microsecond delta is below the noise floor
+        self.assertNotIn("tiny", [f["name"] for f in comparison["regressed_functions"]])
+        
+    def test_compare_reports_picks_up_rewritten_baseline(self):
+        """Test that cached reports are reloaded when the file changes."""
+        baseline_path = self._write_report("baseline.json", total_time=1.0)
+        current_path = self._write_report("current.json", total_time=1.0)
+        
+        comparison = self.profiler.compare_reports(baseline_path, current_path)
+        self.assertEqual(comparison["baseline_time"], 1.0)
+        
+        # Rewrite baseline with a same-length value, so only the mtime changes
+        # in the cache key; bump it explicitly in case the clock is coarse
+        old_mtime_ns = baseline_path.stat().st_mtime_ns
+        self._write_report("baseline.json", total_time=9.0)
+        os.utime(baseline_path, ns=(old_mtime_ns + 10**9, old_mtime_ns + 10**9))
+        
+        comparison = self.profiler.compare_reports(baseline_path, current_path)
+        self.assertEqual(comparison["baseline_time"], 9.0)
+        self.assertFalse(comparison["regression_detected"])
+        
+    def test_compare_reports_result_isolated_from_cache(self):
+        """Test mutating a comparison result doesn't affect later comparisons."""
+        baseline_path = self._write_report(
+            "baseline.json",
+            bottlenecks=["slow_function (50% of total time)"]
+        )
+        current_path = self._write_report("current.json")
+        
+        first = self.profiler.compare_reports(baseline_path, current_path)
+        first["fixed_bottlenecks"].clear()
+        
+        second = self.profiler.compare_reports(baseline_path, current_path)
+        self.assertEqual(len(second["fixed_bottlenecks"]), 1)
+        
     def test_compare_nonexistent_reports(self):
         """Test comparing nonexistent reports raises error."""
         fake_baseline = self.temp_dir / "fake_baseline.json"
@@ -414,9 +682,8 @@ class TestEdgeCases(unittest.TestCase):
         
     def tearDown(self):
         """Clean up after tests."""
-        import shutil
         if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+            _fast_rmtree(self.temp_dir)
             
     def test_profile_empty_script(self):
         """Test profiling empty script."""
@@ -486,23 +753,24 @@ class TestCrossPlatform(unittest.TestCase):
     
     def test_output_directory_creation(self):
         """Test output directory creation works on all platforms."""
-        import tempfile
         temp_dir = Path(tempfile.mkdtemp())
         
         try:
             output_dir = temp_dir / "profilescope" / "reports"
             profiler = ProfileScope(output_dir=output_dir)
             
+            script = temp_dir / "test.py"
+            script.write_text("print('test')")
+            profiler.save_report(profiler.profile(script), format="json")
+            
             self.assertTrue(output_dir.exists())
             
         finally:
-            import shutil
             if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+                _fast_rmtree(temp_dir)
                 
     def test_report_paths_use_pathlib(self):
         """Test that all paths use pathlib for cross-platform compatibility."""
-        import tempfile
         temp_dir = Path(tempfile.mkdtemp())
         
         try:
@@ -519,9 +787,45 @@ class TestCrossPlatform(unittest.TestCase):
             self.assertTrue(isinstance(report_path, Path))
             
         finally:
-            import shutil
             if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+                _fast_rmtree(temp_dir)
+
+
+TEST_CLASSES = (
+    TestProfileScopeCore,
+    TestFunctionStats,
+    TestReportGeneration,
+    TestReportExport,
+    TestReportComparison,
+    TestEdgeCases,
+    TestCrossPlatform,
+)
+
+
+def _run_test_case(class_name):
+    """Run one TestCase class (in a worker process) and return its results."""
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromTestCase(globals()[class_name])
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return stream.getvalue(), result.testsRun, len(result.failures), len(result.errors)
+
+
+def _use_fast_tempdir():
+    """Point tempfile at a RAM-backed directory for test fixtures when available.
+    
+    PROFILESCOPE_TMPDIR overrides the location; on Linux /dev/shm is used,
+    elsewhere the platform default is kept.
+    """
+    temp_root = os.environ.get("PROFILESCOPE_TMPDIR")
+    if temp_root is None:
+        if not (sys.platform.startswith("linux") and os.access("/dev/shm", os.W_OK)):
+            return
+        temp_root = "/dev/shm"
+        
+    os.makedirs(temp_root, exist_ok=True)
+    # TMPDIR too, so worker processes started with spawn agree
+    os.environ["TMPDIR"] = temp_root
+    tempfile.tempdir = temp_root
 
 
 def run_tests():
@@ -530,34 +834,32 @@ def run_tests():
     print("TESTING: ProfileScope v1.0")
     print("=" * 70)
     
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestProfileScopeCore))
-    suite.addTests(loader.loadTestsFromTestCase(TestFunctionStats))
-    suite.addTests(loader.loadTestsFromTestCase(TestReportGeneration))
-    suite.addTests(loader.loadTestsFromTestCase(TestReportExport))
-    suite.addTests(loader.loadTestsFromTestCase(TestReportComparison))
-    suite.addTests(loader.loadTestsFromTestCase(TestEdgeCases))
-    suite.addTests(loader.loadTestsFromTestCase(TestCrossPlatform))
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    _use_fast_tempdir()
     
+    # Test classes are independent (each test uses its own temp dir),
+    # so run them in parallel, one class per worker process
+    workers = min(len(TEST_CLASSES), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_run_test_case, [cls.__name__ for cls in TEST_CLASSES]))
+        
+    tests_run = failures = errors = 0
+    for output, run, failed, errored in results:
+        print(output, end="")
+        tests_run += run
+        failures += failed
+        errors += errored
+        
     # Summary
     print("\n" + "=" * 70)
-    print(f"RESULTS: {result.testsRun} tests")
-    print(f"[OK] Passed: {result.testsRun - len(result.failures) - len(result.errors)}")
-    if result.failures:
-        print(f"[X] Failed: {len(result.failures)}")
-    if result.errors:
-        print(f"[X] Errors: {len(result.errors)}")
+    print(f"RESULTS: {tests_run} tests")
+    print(f"[OK] Passed: {tests_run - failures - errors}")
+    if failures:
+        print(f"[X] Failed: {failures}")
+    if errors:
+        print(f"[X] Errors: {errors}")
     print("=" * 70)
     
-    return 0 if result.wasSuccessful() else 1
+    return 0 if not (failures or errors) else 1
 
 
 if __name__ == "__main__":